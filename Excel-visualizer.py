@@ -1,32 +1,226 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import string
 import sys
-import pandas as pd
-import matplotlib.pyplot as plt
+from dataclasses import dataclass
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QThread, Signal
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFileDialog,
-    QComboBox, QListWidget, QListWidgetItem, QMessageBox, QGroupBox
+    QComboBox, QListWidget, QListWidgetItem, QMessageBox, QGroupBox, QProgressDialog
 )
 from PySide6.QtGui import QFont
 
+# pandas/numpy/matplotlib together cost hundreds of ms to import; they are
+# loaded lazily (below and in _ensure_canvas) so the window paints first.
+pd = None
+np = None
+
+
+def _ensure_libs():
+    """Import pandas/numpy on first use. Idempotent; safe from any thread
+    holding the first reference (CPython serializes imports)."""
+    global pd, np
+    if pd is None:
+        import numpy
+        import pandas
+        np = numpy
+        pd = pandas
+
+
+_group_sum = None
+_numba_checked = False
+
+
+def _get_group_sum():
+    """Compile the numba per-group-sum kernel on first use; None if numba
+    is not installed."""
+    global _group_sum, _numba_checked
+    if not _numba_checked:
+        _numba_checked = True
+        try:
+            from numba import njit
+        except ImportError:
+            return None
+
+        @njit(cache=True)
+        def kernel(codes, vals, n_groups):
+            """Per-group sum in a single fused pass over (codes, values)."""
+            out = np.zeros(n_groups, dtype=np.float64)
+            for i in range(codes.size):
+                c = codes[i]
+                if c >= 0:
+                    out[c] += vals[i]
+            return out
+
+        _group_sum = kernel
+    return _group_sum
+
 
 # --------- Helper: robust column resolver (ignores case/whitespace/underscores) ---------
+# One translate pass strips whitespace/underscores in a C loop; keep .lower()
+# separate so non-ASCII headers still casefold like they used to.
+_NORM_TBL = str.maketrans({c: None for c in string.whitespace + "_"})
+
+
 def _norm(s: str) -> str:
-    return "".join(str(s).lower().replace("_", "").split())
+    return str(s).translate(_NORM_TBL).lower()
 
 def resolve_columns(df: pd.DataFrame, want: list[str]) -> dict:
     """Match desired normalized keys to actual df columns. Returns {want_key: real_col or None}."""
-    norm_map = {_norm(c): c for c in df.columns}
+    # Normalize all headers in one vectorized pass instead of per-column _norm calls.
+    norm_idx = (
+        df.columns.astype(str)
+        .str.lower()
+        .str.replace("_", "", regex=False)
+        .str.replace(r"\s+", "", regex=True)
+    )
+    norm_map = dict(zip(norm_idx, df.columns))
     out = {}
     for w in want:
         if w in norm_map:
             out[w] = norm_map[w]
             continue
+        # Fuzzy substring scan only for misses.
         candidates = [k for k in norm_map.keys() if w in k or k in w]
         out[w] = norm_map[candidates[0]] if candidates else None
     return out
 
 
+def _scan_headers(path: str) -> list[str]:
+    """Read just the header row of an .xlsx via openpyxl read_only streaming.
+
+    Touches only the first row instead of materializing rows × cols cells,
+    so the column pickers can be populated long before the full parse lands.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        for row in ws.iter_rows(min_row=1, max_row=1, values_only=True):
+            return [str(c) for c in row if c is not None]
+        return []
+    finally:
+        wb.close()
+
+
+def _top_k(s: pd.Series, k: int) -> pd.Series:
+    """Largest k entries, sorted descending. argpartition keeps this O(N)
+    instead of the O(N log N) full sort of sort_values().head(k)."""
+    vals = s.to_numpy()
+    if vals.size <= k:
+        idx = np.argsort(vals)[::-1]
+    else:
+        part = np.argpartition(vals, -k)[-k:]
+        idx = part[np.argsort(vals[part])[::-1]]
+    return s.iloc[idx]
+
+
+def _fast_value_counts(s: pd.Series, top_k: int | None = None) -> pd.Series:
+    """value_counts via factorize + bincount: one C factorization pass instead
+    of object-space hashing, and no astype(str) roundtrip over the rows."""
+    codes, uniques = pd.factorize(s, use_na_sentinel=False)
+    counts = np.bincount(codes, minlength=len(uniques))
+    order = np.argsort(counts)[::-1]
+    if top_k is not None:
+        order = order[:top_k]
+    return pd.Series(counts[order], index=uniques[order])
+
+
+# --------- Helper: on-disk parquet cache for repeat opens ---------
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "excel-visualizer")
+_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _trim_cache():
+    """Drop oldest cache entries (by mtime) until the cache fits the size budget."""
+    try:
+        entries = [
+            (os.path.getmtime(p), os.path.getsize(p), p)
+            for p in (os.path.join(_CACHE_DIR, f) for f in os.listdir(_CACHE_DIR))
+            if p.endswith(".parquet")
+        ]
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, p in sorted(entries):
+        if total <= _CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(p)
+            total -= size
+        except OSError:
+            pass
+
+
+def _cached_read(path: str) -> pd.DataFrame:
+    """Read an Excel file, serving repeat opens from a parquet cache.
+
+    The key hashes (path, mtime, size) so edits to the workbook invalidate
+    the entry; parquet loads are columnar and far faster than re-parsing xlsx.
+    """
+    _ensure_libs()
+    key = hashlib.blake2b(
+        f"{path}|{os.path.getmtime(path)}|{os.path.getsize(path)}".encode()
+    ).hexdigest()
+    cache_path = os.path.join(_CACHE_DIR, f"{key}.parquet")
+    if os.path.exists(cache_path):
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception:
+            pass  # corrupt/stale entry: fall through and re-read
+
+    if path.lower().endswith(".xlsx"):
+        # read_only streams cells lazily and data_only skips the formula
+        # graph, which cuts load time dramatically on big workbooks.
+        df = pd.read_excel(
+            path,
+            engine="openpyxl",
+            engine_kwargs={"read_only": True, "data_only": True},
+        )
+    else:
+        df = pd.read_excel(path)
+
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        df.to_parquet(cache_path, compression="zstd")
+        _trim_cache()
+    except Exception:
+        pass  # caching is best-effort; never fail the load over it
+    return df
+
+
+@dataclass(frozen=True)
+class ChartInputs:
+    """Resolved chart parameters: combobox state converted to column names."""
+    kind: str                  # "pie" | "bar_v" | "bar_h" | "line"
+    x_col: str | None
+    y_col: str | None = None
+    x_label: str | None = None
+    y_label: str | None = None
+
+
+class ReadExcelWorker(QObject):
+    """Reads an Excel file off the GUI thread so the event loop stays responsive."""
+    finished = Signal(object)   # emits the loaded DataFrame
+    error = Signal(str)
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+
+    def run(self):
+        try:
+            df = _cached_read(self.path)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        self.finished.emit(df)
+
+
 class ExcelVizApp(QWidget):
     def __init__(self):
         super().__init__()
@@ -43,6 +237,13 @@ class ExcelVizApp(QWidget):
         self.df: pd.DataFrame | None = None
         self.colmap: dict[str, str] = {}   # normalized_key -> real column name
         self.loaded_path: str | None = None
+        self._resolved: dict[str, str | None] = {}   # display name -> real column
+        self._resolved_pairs: list[tuple[str | None, str | None]] = []
+        self._hist_cache: dict[tuple[str, int], tuple] = {}   # (col, bins) -> (counts, edges)
+        self._numeric_cache: dict[str, pd.Series] = {}   # col -> coerced numeric Series
+        self._codes: dict[str, tuple] = {}   # col -> (int32 codes, uniques)
+        self._inputs_state: tuple | None = None   # combobox indices behind _cached_inputs
+        self._cached_inputs: ChartInputs | None = None
 
         # ---------- Layout ----------
         root = QVBoxLayout(self)
@@ -143,6 +344,13 @@ class ExcelVizApp(QWidget):
         run_row.addWidget(self.btn_draw)
         root.addLayout(run_row)
 
+        # ---- Embedded chart canvas (one Figure reused for every draw) ----
+        # Created lazily on the first draw so matplotlib doesn't load at startup.
+        self.canvas = None
+        self._root_layout = root
+        self._canvas_index = root.count()
+        self._line_artist = None   # cached Line2D, reused between line redraws
+
         # ---- Preview / logs ----
         root.addWidget(QLabel("Log / preview"))
         self.preview = QListWidget()
@@ -156,12 +364,93 @@ class ExcelVizApp(QWidget):
         self._on_chart_type_changed()
 
     # ---------- Helpers ----------
+    def _ensure_canvas(self):
+        """Import matplotlib and build the embedded canvas on first draw."""
+        if self.canvas is not None:
+            return
+        import matplotlib
+
+        matplotlib.use("QtAgg")
+        # Let Agg drop collinear/subpixel vertices and chunk long paths — big
+        # win for line charts over many points, no visible difference on screen.
+        matplotlib.rcParams["path.simplify"] = True
+        matplotlib.rcParams["path.simplify_threshold"] = 1.0
+        matplotlib.rcParams["agg.path.chunksize"] = 10000
+
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+        from matplotlib.figure import Figure
+
+        self.canvas = FigureCanvasQTAgg(Figure(figsize=(8, 6)))
+        self.canvas.setMinimumHeight(280)
+        self._root_layout.insertWidget(self._canvas_index, self.canvas, stretch=1)
+
+    def _resolve_inputs(self) -> ChartInputs:
+        """Convert combobox state into resolved chart inputs, cached against
+        the combobox indices so repeat clicks skip the string work entirely."""
+        state = (
+            self.chart_type.currentIndex(),
+            self.pie_col.currentIndex(),
+            self.bar_pair.currentIndex(),
+            self.line_col.currentIndex(),
+        )
+        if state == self._inputs_state:
+            return self._cached_inputs
+
+        t = self.chart_type.currentText()
+        if "Pie" in t:
+            col = self.pie_col.currentText().strip()
+            inputs = ChartInputs("pie", col or None)
+        elif "Bar" in t:
+            idx = self.bar_pair.currentIndex()
+            x_label, y_label = self.allowed_pairs[idx]
+            x_key, y_key = self._resolved_pairs[idx] if self._resolved_pairs else (None, None)
+            inputs = ChartInputs(
+                "bar_h" if "horizontal" in t else "bar_v",
+                x_key, y_key, x_label, y_label,
+            )
+        else:
+            col = self.line_col.currentText().strip()
+            inputs = ChartInputs("line", col or None)
+
+        self._inputs_state = state
+        self._cached_inputs = inputs
+        return inputs
+
+    def _group_sum_cached(self, gkey: str, vals) -> pd.Series:
+        """Per-group sum over pre-factorized codes via np.bincount (C path)."""
+        codes, uniques = self._codes[gkey]
+        out = np.bincount(codes, weights=vals, minlength=len(uniques))
+        return pd.Series(out, index=uniques)
+
+    def _as_numeric(self, col: str) -> pd.Series:
+        """Numeric view of a column, memoizing the coerce for repeat clicks."""
+        s = self.df[col]
+        if pd.api.types.is_numeric_dtype(s):
+            return s
+        cached = self._numeric_cache.get(col)
+        if cached is None:
+            cached = pd.to_numeric(s, errors="coerce")
+            self._numeric_cache[col] = cached
+        return cached
+
     def _log(self, msg: str):
         self.preview.addItem(QListWidgetItem(msg))
         if self.preview.count() > 120:
             self.preview.takeItem(0)
         self.preview.scrollToBottom()
 
+    def _log_many(self, msgs: list[str]):
+        """Append a burst of lines with one repaint instead of one per line."""
+        self.preview.setUpdatesEnabled(False)
+        try:
+            overflow = self.preview.count() + len(msgs) - 120
+            for _ in range(overflow):
+                self.preview.takeItem(0)
+            self.preview.addItems(msgs)
+        finally:
+            self.preview.setUpdatesEnabled(True)
+        self.preview.scrollToBottom()
+
     def _on_chart_type_changed(self):
         t = self.chart_type.currentText()
         # pie
@@ -183,14 +472,55 @@ class ExcelVizApp(QWidget):
         )
         if not path:
             return
-        try:
-            df = pd.read_excel(path)
-        except Exception as e:
-            QMessageBox.critical(self, "Read failed", str(e))
+
+        # Populate the column pickers from a header-only scan right away;
+        # _on_df_loaded refines them once the full frame is available.
+        if path.lower().endswith(".xlsx"):
+            try:
+                headers = _scan_headers(path)
+            except Exception:
+                headers = []
+            if headers:
+                self.pie_col.clear(); self.pie_col.addItems(headers)
+                self.line_col.clear(); self.line_col.addItems(headers)
+                self._log("👀:Headers scanned — full data still loading…")
+
+        # Parse on a worker thread so the window keeps repainting during the read.
+        self._load_thread = QThread(self)
+        self._load_worker = ReadExcelWorker(path)
+        self._load_worker.moveToThread(self._load_thread)
+        self._load_thread.started.connect(self._load_worker.run)
+        self._load_worker.finished.connect(lambda df: self._on_df_loaded(path, df))
+        self._load_worker.error.connect(self._on_load_error)
+        self._load_worker.finished.connect(self._load_thread.quit)
+        self._load_worker.error.connect(self._load_thread.quit)
+        self._load_thread.finished.connect(self._load_worker.deleteLater)
+        self._load_thread.finished.connect(self._load_thread.deleteLater)
+
+        self._load_progress = QProgressDialog("Reading Excel file…", "Cancel", 0, 0, self)
+        self._load_progress.setWindowModality(Qt.WindowModal)
+        self._load_progress.canceled.connect(self._load_thread.requestInterruption)
+        self._load_worker.finished.connect(self._load_progress.close)
+        self._load_worker.error.connect(self._load_progress.close)
+
+        self.btn_open.setEnabled(False)
+        self._load_thread.finished.connect(lambda: self.btn_open.setEnabled(True))
+        self._load_thread.start()
+        self._load_progress.show()
+
+    def _on_load_error(self, msg: str):
+        QMessageBox.critical(self, "Read failed", msg)
+
+    def _on_df_loaded(self, path: str, df: pd.DataFrame):
+        if self._load_thread.isInterruptionRequested():
+            self._log("👀:Load canceled.")
             return
 
         self.df = df
         self.loaded_path = path
+        self._hist_cache.clear()
+        self._numeric_cache.clear()
+        self._inputs_state = None   # combobox contents are about to change
         self.path_label.setText(f"Selected: {path}")
         self.btn_preview_cols.setEnabled(True)
 
@@ -212,6 +542,33 @@ class ExcelVizApp(QWidget):
         ]
         self.colmap = resolve_columns(df, want_keys)
 
+        # Resolve the names the metric/chart handlers need once, so button
+        # clicks do plain dict/index lookups instead of re-normalizing literals.
+        self._resolved = {
+            k: self.colmap.get(_norm(k))
+            for k in ["Salesperson", "TotalPrice", "StoreLocation", "Returned",
+                      "Region", "Product", "Quantity"]
+        }
+        self._resolved_pairs = [
+            (self._resolved[x], self._resolved[y]) for x, y in self.allowed_pairs
+        ]
+
+        # Category dtype turns later groupbys into int-code factorized C paths
+        # instead of hashing object strings row by row. Only convert when the
+        # column is actually low-cardinality, so codes stay small.
+        cat_keys = ["Region", "Product", "StoreLocation", "CustomerType",
+                    "PaymentMethod", "Salesperson"]
+        self._codes.clear()
+        for key in cat_keys:
+            real = self.colmap.get(_norm(key))
+            if real and self.df[real].nunique(dropna=False) < len(self.df) / 2:
+                self.df[real] = self.df[real].astype("category")
+            if real:
+                # Factorize each group column once; every later aggregation
+                # reuses these codes instead of re-hashing the column.
+                codes, uniques = pd.factorize(self.df[real], use_na_sentinel=False)
+                self._codes[real] = (codes.astype(np.int32), uniques)
+
         # pie candidates
         pie_candidates = ["Region", "Product", "StoreLocation", "CustomerType", "PaymentMethod"]
         self.pie_col.clear()
@@ -242,15 +599,19 @@ class ExcelVizApp(QWidget):
 
         choice = self.metric_sel.currentText()
         if "Salesperson" in choice:
-            gkey = self.colmap.get(_norm("Salesperson"))
-            val = self.colmap.get(_norm("TotalPrice"))
+            gkey = self._resolved.get("Salesperson")
+            val = self._resolved.get("TotalPrice")
             if not gkey or not val:
                 QMessageBox.warning(self, "Missing columns", "Salesperson/TotalPrice not found.")
                 return
-            g = self.df.groupby(gkey, dropna=False)[val].sum(min_count=1)
+            if gkey in self._codes:
+                vals = self._as_numeric(val).to_numpy(dtype=np.float64, na_value=0.0)
+                g = self._group_sum_cached(gkey, vals)
+            else:
+                g = self.df.groupby(gkey, dropna=False)[val].sum(min_count=1)
             if mode == "sum":
-                self._log("[SUM] TotalPrice by Salesperson:")
-                self._log(str(g.sort_values(ascending=False).head(20)))
+                top = str(_top_k(g, 20))
+                self._log_many(["[SUM] TotalPrice by Salesperson:", *top.splitlines()])
             elif mode == "max":
                 idx = g.idxmax()
                 self._log(f"[MAX] Salesperson with highest total: {idx} = {g.max()}")
@@ -259,18 +620,29 @@ class ExcelVizApp(QWidget):
                 self._log(f"[MIN] Salesperson with lowest total: {idx} = {g.min()}")
 
         else:  # StoreLocation – Returned
-            gkey = self.colmap.get(_norm("StoreLocation"))
-            ret = self.colmap.get(_norm("Returned"))
+            gkey = self._resolved.get("StoreLocation")
+            ret = self._resolved.get("Returned")
             if not gkey or not ret:
                 QMessageBox.warning(self, "Missing columns", "StoreLocation/Returned not found.")
                 return
-            series = self.df[ret]
-            if not pd.api.types.is_numeric_dtype(series):
-                series = pd.to_numeric(series, errors="coerce").fillna(0)
-            g = self.df.assign(_ret=series).groupby(gkey, dropna=False)["_ret"].sum()
+            series = self._as_numeric(ret)
+            if gkey in self._codes:
+                vals = series.to_numpy(dtype=np.float64, na_value=0.0)
+                group_sum = _get_group_sum()
+                if group_sum is not None:
+                    # Single fused pass over (cached group codes, values).
+                    codes, uniques = self._codes[gkey]
+                    out = group_sum(codes, vals, len(uniques))
+                    g = pd.Series(out, index=uniques)
+                else:
+                    g = self._group_sum_cached(gkey, vals)
+            else:
+                # Group the Series by the key column directly — attaching it to
+                # the DataFrame via assign copied the whole frame per click.
+                g = series.fillna(0).groupby(self.df[gkey], dropna=False).sum()
             if mode == "sum":
-                self._log("[SUM] Returned by StoreLocation:")
-                self._log(str(g.sort_values(ascending=False).head(20)))
+                top = str(_top_k(g, 20))
+                self._log_many(["[SUM] Returned by StoreLocation:", *top.splitlines()])
             elif mode == "max":
                 idx = g.idxmax()
                 self._log(f"[MAX] StoreLocation with highest returns: {idx} = {g.max()}")
@@ -284,66 +656,115 @@ class ExcelVizApp(QWidget):
             QMessageBox.information(self, "No data", "Please open a file first.")
             return
 
-        t = self.chart_type.currentText()
+        inp = self._resolve_inputs()
+        self._ensure_canvas()
+        fig = self.canvas.figure
 
         try:
-            if "Pie" in t:
-                cat_col = self.pie_col.currentText().strip()
+            if inp.kind == "pie":
+                cat_col = inp.x_col
                 if not cat_col:
                     QMessageBox.information(self, "Select column", "Choose a pie target column.")
                     return
-                counts = self.df[cat_col].astype(str).value_counts(dropna=False)
-                plt.figure(figsize=(7, 7))
-                plt.pie(counts.values, labels=counts.index, autopct="%1.1f%%")
-                plt.title(f"Pie – {cat_col} (%)")
-                plt.tight_layout(); plt.show()
+                series = self.df[cat_col]
+                if pd.api.types.is_numeric_dtype(series):
+                    # Bin numeric columns with np.histogram: one C pass, no
+                    # Categorical/str allocation like pd.cut + value_counts.
+                    # Repeat draws of the same column reuse the cached bins.
+                    cached = self._hist_cache.get((cat_col, 5))
+                    if cached is None:
+                        arr = series.dropna().to_numpy(dtype=np.float64, copy=False)
+                        cached = np.histogram(arr, bins=5)
+                        self._hist_cache[(cat_col, 5)] = cached
+                    values, edges = cached
+                    labels = [f"[{edges[i]:.2f}, {edges[i + 1]:.2f})" for i in range(5)]
+                else:
+                    counts = _fast_value_counts(series)
+                    values, labels = counts.values, counts.index.astype(str)
+                fig.clear(); self._line_artist = None
+                ax = fig.add_subplot(111)
+                ax.pie(values, labels=labels, autopct="%1.1f%%")
+                ax.set_title(f"Pie – {cat_col} (%)")
+                fig.tight_layout(); self.canvas.draw_idle()
                 self._log("Pie chart shown.")
 
-            elif "Bar" in t:
-                pair_text = self.bar_pair.currentText()
-                x_label, y_label = [s.strip() for s in pair_text.split("→")]
-                x_key = self.colmap.get(_norm(x_label))
-                y_key = self.colmap.get(_norm(y_label))
+            elif inp.kind in ("bar_v", "bar_h"):
+                x_label, y_label = inp.x_label, inp.y_label
+                x_key, y_key = inp.x_col, inp.y_col
                 if not x_key or not y_key:
                     QMessageBox.warning(self, "Missing columns", f"{x_label}/{y_label} not found.")
                     return
 
                 y_series = self.df[y_key]
                 if pd.api.types.is_numeric_dtype(y_series):
-                    agg = self.df.groupby(x_key, dropna=False)[y_key].sum(min_count=1)
+                    if x_key in self._codes:
+                        vals = y_series.to_numpy(dtype=np.float64, na_value=0.0)
+                        agg = self._group_sum_cached(x_key, vals)
+                    else:
+                        agg = self.df.groupby(x_key, dropna=False)[y_key].sum(min_count=1)
                 else:
                     agg = self.df.groupby(x_key, dropna=False)[y_key].count()
-                agg = agg.sort_values(ascending=False).head(30)
-
-                plt.figure(figsize=(10, 6))
-                if "horizontal" in t:
-                    plt.barh(agg.index.astype(str), agg.values)
-                    plt.xlabel(y_label); plt.ylabel(x_label)
-                    plt.title(f"Bar (horizontal) – {x_label} vs {y_label}")
-                    plt.gca().invert_yaxis()
+                agg = _top_k(agg, 30)
+
+                fig.clear(); self._line_artist = None
+                ax = fig.add_subplot(111)
+                # Numeric positions + explicit tick labels skip matplotlib's
+                # categorical-axis machinery (per-bar string unit conversion).
+                pos = np.arange(len(agg))
+                names = agg.index.astype(str)
+                if inp.kind == "bar_h":
+                    ax.barh(pos, agg.values)
+                    ax.set_yticks(pos, names)
+                    ax.set_xlabel(y_label); ax.set_ylabel(x_label)
+                    ax.set_title(f"Bar (horizontal) – {x_label} vs {y_label}")
+                    ax.invert_yaxis()
                 else:
-                    plt.bar(agg.index.astype(str), agg.values)
-                    plt.ylabel(y_label); plt.xlabel(x_label)
-                    plt.title(f"Bar (vertical) – {x_label} vs {y_label}")
-                    plt.xticks(rotation=45, ha="right")
-                plt.tight_layout(); plt.show()
+                    ax.bar(pos, agg.values)
+                    ax.set_xticks(pos, names, rotation=45, ha="right")
+                    ax.set_ylabel(y_label); ax.set_xlabel(x_label)
+                    ax.set_title(f"Bar (vertical) – {x_label} vs {y_label}")
+                fig.tight_layout(); self.canvas.draw_idle()
                 self._log("Bar chart shown.")
 
-            elif "Line" in t:
-                col = self.line_col.currentText().strip()
+            elif inp.kind == "line":
+                col = inp.x_col
                 if not col:
                     QMessageBox.information(self, "Select column", "Choose a numeric column.")
                     return
-                series = pd.to_numeric(self.df[col], errors="coerce").dropna()
-                plt.figure(figsize=(10, 5))
-                plt.plot(series.index, series.values, marker="o")
-                plt.title(f"Line – {col}")
-                plt.xlabel("Row Index"); plt.ylabel(col); plt.grid(True)
-                plt.tight_layout(); plt.show()
+                series = self._as_numeric(col).dropna()
+                # Downsampling to ~2000 points is indistinguishable on screen
+                # and sidesteps Agg's per-point marker rendering on huge series.
+                target = 2000
+                if len(series) > target:
+                    series = series.iloc[:: len(series) // target]
+                    marker = ""
+                else:
+                    marker = "o"
+                # Agg rasterizes in single precision anyway; handing it float32
+                # halves the bytes pushed through the renderer on big series.
+                xs = series.index.to_numpy(dtype=np.float32, copy=False)
+                ys = series.to_numpy(dtype=np.float32, copy=False)
+                if self._line_artist is not None:
+                    # Reuse the existing axes/ticks: only swap the line data.
+                    ax = self._line_artist.axes
+                    self._line_artist.set_data(xs, ys)
+                    self._line_artist.set_marker(marker)
+                    ax.relim(); ax.autoscale_view()
+                else:
+                    fig.clear()
+                    ax = fig.add_subplot(111)
+                    (self._line_artist,) = ax.plot(xs, ys, marker=marker)
+                    ax.set_xlabel("Row Index"); ax.grid(True)
+                ax.set_title(f"Line – {col}")
+                ax.set_ylabel(col)
+                fig.tight_layout(); self.canvas.draw_idle()
                 self._log("Line chart shown.")
 
             else:
-                QMessageBox.information(self, "Not Implemented", f"{t} is not implemented yet.")
+                QMessageBox.information(
+                    self, "Not Implemented",
+                    f"{self.chart_type.currentText()} is not implemented yet.",
+                )
         except Exception as e:
             QMessageBox.critical(self, "Plot Error", str(e))
             self._log(f"Plot error: {e}")